@@ -2,29 +2,40 @@
 # --- Basic Imports ---
 from __future__ import annotations
 import streamlit as st
-import random
 from datetime import datetime, date, time, timedelta, timezone
 import traceback
 import os
+import io
+import gzip
+import csv
 import urllib.parse
 import pandas as pd
 import math
+import functools
+import importlib.util
+import hashlib
+import codecs
+from typing import TYPE_CHECKING
 import numpy as np # Needed for Redshift Calc
+if TYPE_CHECKING: from matplotlib.figure import Figure # Annotations only - matplotlib itself is imported on the first plot
 
 # --- Library Imports ---
 try:
     from astropy.time import Time
     import astropy.units as u
-    from astropy.coordinates import EarthLocation, SkyCoord, get_sun, AltAz, get_constellation
+    from astropy.coordinates import EarthLocation, SkyCoord, Angle, get_sun, AltAz, get_constellation
+    from astropy.coordinates.erfa_astrom import erfa_astrom, ErfaAstromInterpolator
     from astroplan import Observer
     from astroplan.moon import moon_illumination
-    import matplotlib.pyplot as plt
-    import matplotlib.dates as mdates
+    from astropy.utils import iers
+    iers.conf.auto_download = False # Bundled IERS tables (astropy-iers-data, pinned in requirements.txt) - no blocking download on the first transform
+    if importlib.util.find_spec('matplotlib') is None: raise ImportError("No module named 'matplotlib'") # Imported on the first plot (_pyplot), only checked here
     import pytz
     from timezonefinder import TimezoneFinder
     from geopy.geocoders import Nominatim, ArcGIS, Photon
     from geopy.exc import GeocoderTimedOut, GeocoderServiceError
     from scipy.integrate import quad # Needed for Redshift Calc
+    from packaging.version import Version
 except ImportError as e:
     st.error(f"Error: Missing libraries. Please install required packages (check astroplan, astropy, scipy, etc.). ({e})")
     st.stop()
@@ -50,6 +61,18 @@ CATALOG_FILEPATH = os.path.join(APP_DIR, CATALOG_FILENAME)
 # --- Constants ---
 CARDINAL_DIRECTIONS = ["N", "NE", "E", "SE", "S", "SW", "W", "NW"]
 ALL_DIRECTIONS_KEY = 'All'
+# Radio option keys (labels are translated per run, the keys are constant)
+LANGUAGE_NAMES = {'de': 'Deutsch', 'en': 'English', 'fr': 'Français'}; LANGUAGE_KEYS = tuple(LANGUAGE_NAMES); LANGUAGE_INDEX = {k: i for i, k in enumerate(LANGUAGE_KEYS)}
+LOCATION_KEYS = ('Search', 'Manual'); TIME_KEYS = ('Now', 'Specific'); MAG_FILTER_KEYS = ('Bortle Scale', 'Manual')
+SORT_KEYS = ('Duration & Altitude', 'Brightness'); PLOT_TYPE_KEYS = ('Sky Path', 'Altitude Plot')
+GEOCODER_USER_AGENT = "AdvancedDSOFinder" # Stable agent (Nominatim policy) - no per-search random string
+DOWNLOAD_DATA_CALLABLE = Version(st.__version__) >= Version("1.52") # st.download_button(data=callable) defers building the file until the click
+EXPORT_RESULT_KEYS = ('Name', 'Type', 'Constellation', 'Magnitude', 'Size (arcmin)', 'RA', 'Dec', 'Max Altitude (°)', 'Azimuth at Max (°)', 'Direction at Max') # Copied as-is into the CSV
+CSV_CHUNK_ROWS = 1024 # Rows encoded per block when writing the results CSV
+EXPORT_FLOAT_COLUMNS = (False, False, False, True, True, False, False, True, True, False, False, False, True) # Per CSV column: numeric (float or None) vs text
+SEARCH_STEP_MIN = 10 # Time grid step for the object search (AltAz cost scales linearly with the number of samples)
+PEAK_REFINE_SAMPLES = 9 # Samples across +-1 search step around each coarse peak (odd, so the coarse peak itself is kept)
+ERFA_INTERP_MIN = 5 # Knot spacing for the interpolated ERFA astrometry parameters in the search transforms (error far below 1 arcsec)
 
 # --- Constants for Redshift Calculator ---
 C_KM_PER_S = 299792.458
@@ -75,7 +98,7 @@ tf = get_timezone_finder()
 def initialize_session_state():
     defaults = {
         # DSO Finder State
-        'language': 'de', 'plot_object_name': None, 'show_plot': False, 'active_result_plot_data': None,
+        'language': 'de', 'plot_object_index': None, 'show_plot': False, 'active_result_plot_data': None,
         'last_results': [], 'find_button_pressed': False, 'location_choice_key': 'Search',
         'manual_lat_val': INITIAL_LAT, 'manual_lon_val': INITIAL_LON, 'manual_height_val': INITIAL_HEIGHT,
         'location_search_query': "", 'searched_location_name': None, 'location_search_status_msg': "",
@@ -85,8 +108,9 @@ def initialize_session_state():
         'size_arcmin_range': [1.0, 120.0], 'sort_method': 'Duration & Altitude',
         'selected_peak_direction': ALL_DIRECTIONS_KEY, 'plot_type_selection': 'Sky Path', 'custom_target_ra': "",
         'custom_target_dec': "", 'custom_target_name': "", 'custom_target_error': "", 'custom_target_plot_data': None,
-        'show_custom_plot': False, 'expanded_object_name': None, 'location_is_valid_for_run': False,
-        'time_choice_exp': 'Now', 'window_start_time': None, 'window_end_time': None, 'selected_date_widget': date.today(),
+        'show_custom_plot': False, 'expanded_object_index': None, 'location_is_valid_for_run': False,
+        'time_choice_exp': 'Now', 'window_start_time': None, 'window_end_time': None, 'window_moon_illum': None, 'selected_date_widget': date.today(),
+        'csv_gzip': False, 'csv_file_stamp': None,
         # Redshift Calculator State
         'redshift_z_input': 0.1, 'redshift_h0_input': H0_DEFAULT, 'redshift_omega_m_input': OMEGA_M_DEFAULT,
         'redshift_omega_lambda_input': OMEGA_LAMBDA_DEFAULT,
@@ -95,20 +119,51 @@ def initialize_session_state():
         if key not in st.session_state: st.session_state[key] = default_value
 
 # --- Helper Functions ---
+@functools.lru_cache(maxsize=32)
+def _get_timezone(timezone_str: str):
+    # tzinfo objects are immutable - build each one once per process instead of once per result row
+    return pytz.timezone(timezone_str)
+
+@functools.lru_cache(maxsize=16)
+def _make_location(lat: float, lon: float, height: float) -> EarthLocation:
+    # EarthLocation does unit parsing + geodetic -> geocentric conversion; same coordinates, same object
+    return EarthLocation(lat=lat*u.deg, lon=lon*u.deg, height=height*u.m)
+
+@functools.lru_cache(maxsize=8)
+def get_observer(lat: float, lon: float, height: float, tz: str) -> Observer:
+    # Built on every rerun otherwise - reuse it while the location is unchanged; a timezone change alone keeps the cached EarthLocation
+    return Observer(location=_make_location(lat, lon, height), timezone=_get_timezone(tz))
+
+@functools.lru_cache(maxsize=4)
+def get_custom_altaz_frame(observer: Observer, start_jd: float, end_jd: float) -> AltAz:
+    # 5-min grid + AltAz frame for custom targets, built once per window/location (observer comes from the get_observer cache) - later targets reuse it
+    return AltAz(obstime=Time(np.arange(start_jd, end_jd, (5*u.min).to_value(u.day)), format='jd', scale='utc'), location=observer.location)
+
 def get_magnitude_limit(bortle_scale: int) -> float:
     limits = {1: 15.5, 2: 15.5, 3: 14.5, 4: 14.5, 5: 13.5, 6: 12.5, 7: 11.5, 8: 10.5, 9: 9.5}
     return limits.get(bortle_scale, 9.5)
 
+_DIRECTION_LOOKUP = np.array(CARDINAL_DIRECTIONS + ["N/A"], dtype=object) # Last slot for NaN azimuths
+
+def azimuths_to_directions(azimuths_deg: np.ndarray) -> np.ndarray:
+    # One sector index per azimuth (each direction covers +-22.5 deg around its bearing), then a single gather
+    az = np.asarray(azimuths_deg, dtype=float); sector = np.floor((az % 360 + 22.5) / 45) % 8
+    return _DIRECTION_LOOKUP[np.where(np.isnan(az), len(CARDINAL_DIRECTIONS), sector).astype(int)]
+
 def azimuth_to_direction(azimuth_deg: float) -> str:
-    if math.isnan(azimuth_deg): return "N/A"
-    azimuth_deg %= 360
-    index = round((azimuth_deg + 22.5) / 45) % 8
-    return CARDINAL_DIRECTIONS[max(0, min(index, len(CARDINAL_DIRECTIONS) - 1))]
+    return azimuths_to_directions(np.array([azimuth_deg]))[0]
+
+def _on_language_change():
+    # Runs before the rerun Streamlit already does for the click - no extra st.rerun() pass needed
+    st.session_state.update({'language': st.session_state.language_radio, 'location_search_status_msg': ""})
 
 def create_moon_phase_svg(illumination: float, size: int = 100) -> str:
-    # (Unchanged)
     if not 0 <= illumination <= 1: print(f"Warn: Invalid moon illum ({illumination})."); illumination = max(0.0, min(1.0, illumination))
-    radius = size / 2; cx = cy = radius
+    return _moon_svg_cached(round(illumination * 100), size) # Display granularity is 1% - reruns reuse the same string
+
+@functools.lru_cache(maxsize=128)
+def _moon_svg_cached(pct: int, size: int) -> str:
+    illumination = pct / 100; radius = size / 2; cx = cy = radius
     light_color = "var(--text-color, #e0e0e0)"; dark_color = "var(--secondary-background-color, #333333)"
     svg = f'<svg width="{size}" height="{size}" viewBox="0 0 {size} {size}"><circle cx="{cx}" cy="{cy}" r="{radius}" fill="{dark_color}"/>'
     if illumination < 0.01: pass
@@ -121,12 +176,24 @@ def create_moon_phase_svg(illumination: float, size: int = 100) -> str:
         svg += f'<path d="{d}" fill="{light_color}"/>'
     return svg + '</svg>'
 
+def _parse_angles(values: np.ndarray, unit: u.Unit) -> np.ndarray:
+    # Sexagesimal strings -> float degrees in one Angle call; unparsable entries become NaN
+    try: return Angle(values, unit=unit).deg
+    except ValueError:
+        out = np.full(len(values), np.nan)
+        for i, v in enumerate(values):
+            try: out[i] = Angle(v, unit=unit).deg
+            except ValueError: pass
+        return out
+
+@st.cache_resource(show_spinner=False)
 def load_ongc_data(catalog_path: str, lang: str) -> pd.DataFrame | None:
-    # (Unchanged)
+    # Parsed once per process and shared read-only (no per-rerun pickle copy) - callers must .copy() before mutating
     t_load = get_translation(lang); required_cols = ['Name', 'RA', 'Dec', 'Type']; mag_cols = ['V-Mag', 'B-Mag', 'Mag']; size_col = 'MajAx'
     try:
         if not os.path.exists(catalog_path): st.error(f"{t_load.get('error_loading_catalog', 'Error:').split(':')[0]}: File not found"); return None
-        df = pd.read_csv(catalog_path, sep=';', comment='#', low_memory=False)
+        wanted_cols = {*required_cols, *mag_cols, size_col} # Only the columns used below are parsed (7 of ~30 in OpenNGC)
+        df = pd.read_csv(catalog_path, sep=';', comment='#', low_memory=False, usecols=lambda col: col in wanted_cols)
         missing_req_cols = [col for col in required_cols if col not in df.columns]
         if missing_req_cols: st.error(f"Missing required columns: {', '.join(missing_req_cols)}"); return None
         df['RA_str'] = df['RA'].astype(str).str.strip(); df['Dec_str'] = df['Dec'].astype(str).str.strip()
@@ -149,10 +216,19 @@ def load_ongc_data(catalog_path: str, lang: str) -> pd.DataFrame | None:
         final_cols = ['Name', 'RA_str', 'Dec_str', 'Mag', 'Type', size_col]; final_cols_exist = [col for col in final_cols if col in df_filtered.columns]
         df_final = df_filtered[final_cols_exist].copy()
         df_final.drop_duplicates(subset=['Name'], inplace=True, keep='first'); df_final.reset_index(drop=True, inplace=True)
+        df_final['Type'] = df_final['Type'].astype(str).astype('category') # Few distinct codes: isin() filters on integer codes, categories give the type list
+        df_final['RA_deg'] = _parse_angles(df_final['RA_str'].to_numpy(), u.hourangle); df_final['Dec_deg'] = _parse_angles(df_final['Dec_str'].to_numpy(), u.deg) # Parsed once here, searches use the floats
+        bad_coords = df_final['RA_deg'].isna() | df_final['Dec_deg'].isna()
+        if bad_coords.any(): print(f"Dropped {bad_coords.sum()} rows with unparsable RA/Dec: {', '.join(df_final.loc[bad_coords, 'Name'].astype(str).head(10))}"); df_final = df_final[~bad_coords].reset_index(drop=True)
         if not df_final.empty: print(f"Catalog loaded: {len(df_final)} objects."); return df_final
         else: st.warning(t_load.get('warning_catalog_empty', 'Catalog empty.')); return None
     except Exception as e: st.error(f"{t_load.get('error_loading_catalog', 'Catalog Error:')} {e}"); traceback.print_exc(); return None
 
+@st.cache_data(show_spinner=False)
+def get_catalog_types(catalog_path: str, _catalog_df: pd.DataFrame) -> list[str]:
+    # Type list only changes with the catalog file - keyed on the path, the (unhashable) frame is skipped by the leading underscore
+    return sorted(_catalog_df['Type'].cat.categories)
+
 def _get_fallback_window(reference_time: Time) -> tuple[Time, Time]:
     # (Unchanged)
     ref_dt = reference_time.to_datetime(timezone.utc); ref_date = ref_dt.date()
@@ -176,8 +252,8 @@ def get_observable_window(observer: Observer, reference_time: Time, is_now: bool
                 sun_ref = observer.sun_altaz(calc_base).alt; sun_12h = observer.sun_altaz(calc_base + 12*u.hour).alt
                 if sun_ref < -18*u.deg and sun_12h < -18*u.deg: status = t.get('error_polar_night', "Polar night?"); start_time, end_time = _get_fallback_window(calc_base)
                 elif sun_ref > -18*u.deg:
-                    times_chk = calc_base + np.linspace(0, 24, 49)*u.hour; sun_alts_chk = observer.sun_altaz(times_chk).alt
-                    if np.min(sun_alts_chk) > -18*u.deg: status = t.get('error_polar_day', "Polar day?"); start_time, end_time = _get_fallback_window(calc_base)
+                    times_chk = calc_base + np.linspace(0, 24, 49)*u.hour; sun_alts_chk = observer.sun_altaz(times_chk).alt.to_value(u.deg) # Plain floats, no Quantity comparison
+                    if sun_alts_chk.min() > -18.0: status = t.get('error_polar_day', "Polar day?"); start_time, end_time = _get_fallback_window(calc_base)
                 if start_time: status += t.get('window_fallback_info', "\nFallback: {} to {} UTC").format(start_time.iso, end_time.iso); return start_time, end_time, status
             except Exception as check_e: print(f"Polar check err: {check_e}")
             raise ValueError("Rise <= Set twilight") # Raise if not polar & failed
@@ -192,7 +268,7 @@ def get_observable_window(observer: Observer, reference_time: Time, is_now: bool
         start_f = start_time.to_datetime(timezone.utc).strftime('%Y-%m-%d %H:%M %Z'); end_f = end_time.to_datetime(timezone.utc).strftime('%Y-%m-%d %H:%M %Z')
         status += t.get('window_info_template', "Window: {} to {} UTC").format(start_f, end_f)
     except Exception as e:
-        status = t.get('window_calc_error', "Win Err: {}\n{}").format(e, traceback.format_exc()); print(f"Win err: {e}")
+        status = t.get('window_calc_error', "Win Err: {}").format(repr(e)); print(f"Win err: {e!r}"); traceback.print_exc() # Full traceback to the console only, the UI gets the short form
         start_time, end_time = _get_fallback_window(calc_base)
         status += t.get('window_fallback_info', "\nFallback: {} to {} UTC").format(start_time.iso, end_time.iso)
     if start_time is None or end_time is None or end_time <= start_time: # Final fallback check
@@ -202,44 +278,80 @@ def get_observable_window(observer: Observer, reference_time: Time, is_now: bool
         start_time, end_time = start_fb, end_fb
     return start_time, end_time, status
 
-def find_observable_objects(observer_location: EarthLocation, observing_times: Time, min_altitude_limit: u.Quantity, catalog_df: pd.DataFrame, lang: str) -> list[dict]:
-    # (Unchanged)
-    t = get_translation(lang); observable_objects = []
-    if not isinstance(observer_location, EarthLocation): st.error("Internal Error: observer_location type"); return []
-    if not isinstance(observing_times, Time) or not observing_times.shape: st.error("Internal Error: observing_times type"); return []
-    if not isinstance(min_altitude_limit, u.Quantity): st.error("Internal Error: min_altitude_limit type"); return []
-    if not isinstance(catalog_df, pd.DataFrame): st.error("Internal Error: catalog_df type"); return []
-    if catalog_df.empty: print("Input catalog_df empty."); return []
-    if len(observing_times) < 2: st.warning("Obs window < 2 points.")
-    altaz_frame = AltAz(obstime=observing_times, location=observer_location); min_alt_deg = min_altitude_limit.to(u.deg).value
+@st.cache_data(ttl=3600, show_spinner=False)
+def get_cached_observable_window(lat: float, lon: float, height: float, tz: str, ref_jd: float, is_now: bool, lang: str) -> tuple[Time | None, Time | None, str, float | None]:
+    # Hashable-argument wrapper: repeated searches for the same place/night skip the twilight computation
+    # The moon illumination at the window midpoint is evaluated in the same cached pass (same night, same entry)
+    start_time, end_time, status = get_observable_window(get_observer(lat, lon, height, tz), Time(ref_jd, format='jd', scale='utc'), is_now, lang); moon_illum = None
+    if start_time is not None and end_time is not None:
+        try: moon_illum = float(moon_illumination(start_time + (end_time - start_time) / 2))
+        except Exception as moon_e: print(f"Warn: Moon illum fail: {moon_e}")
+    return start_time, end_time, status, moon_illum
+
+def _scan_peaks(alts: np.ndarray, min_alt: float) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+    # Per row of an (objects x times) altitude array: (reaches min_alt, argmax index, longest run of samples >= min_alt)
+    above = alts >= min_alt; above_cnt = np.cumsum(above, axis=1) # Longest run: count minus the count at the last gap
+    runs = (above_cnt - np.maximum.accumulate(np.where(above, 0, above_cnt), axis=1)).max(axis=1)
+    return runs > 0, alts.argmax(axis=1), runs
+
+def find_observable_objects(observer_location: EarthLocation, observing_times: Time, min_alt_deg: float, catalog_df: pd.DataFrame, lang: str, max_alt_deg: float = 90.0, peak_direction: str | None = None) -> tuple[list[dict], list[tuple[str, str]]]:
+    # Vectorized over the catalog: one SkyCoord for all rows, one broadcast AltAz transform (objects x times), peaks and runs as array ops
+    # max_alt_deg / peak_direction (None = any) filter on the peak arrays, so result dicts are only built for objects that are kept
+    # Messages come back as (st method name, text) for the caller to show - st.* calls in here would not replay when the cached wrapper hits
+    t = get_translation(lang); observable_objects = []; messages = []
+    if not isinstance(observer_location, EarthLocation): return [], [('error', "Internal Error: observer_location type")]
+    if not isinstance(observing_times, Time) or not observing_times.shape or not len(observing_times): return [], [('error', "Internal Error: observing_times type")]
+    if not isinstance(min_alt_deg, (int, float)): return [], [('error', "Internal Error: min_alt_deg type")] # Plain degrees - units are stripped at the UI boundary
+    if not isinstance(catalog_df, pd.DataFrame): return [], [('error', "Internal Error: catalog_df type")]
+    if catalog_df.empty: print("Input catalog_df empty."); return [], []
+    if len(observing_times) < 2: messages.append(('warning', "Obs window < 2 points."))
     time_step_h = (observing_times[1] - observing_times[0]).sec / 3600.0 if len(observing_times) > 1 else 0
-    for index, obj in catalog_df.iterrows():
-        try:
-            ra, dec, name, type, mag, size = obj.get('RA_str'), obj.get('Dec_str'), obj.get('Name', f"Obj {index}"), obj.get('Type', "?"), obj.get('Mag', np.nan), obj.get('MajAx', np.nan)
-            if not ra or not dec: print(f"Skip '{name}': No RA/Dec."); continue
-            try: coord = SkyCoord(ra=ra, dec=dec, unit=(u.hourangle, u.deg))
-            except ValueError as coord_e: print(f"Skip '{name}': Bad coords {coord_e}"); continue
-            try: altazs = coord.transform_to(altaz_frame); alts = altazs.alt.to(u.deg).value; azs = altazs.az.to(u.deg).value
-            except Exception as trans_e: print(f"Skip '{name}': Transform err {trans_e}"); continue
-            max_alt = np.max(alts) if len(alts) > 0 else -999
-            if max_alt >= min_alt_deg:
-                peak_idx = np.argmax(alts); peak_alt = alts[peak_idx]; peak_time = observing_times[peak_idx]; peak_az = azs[peak_idx]; peak_dir = azimuth_to_direction(peak_az)
-                try: const = get_constellation(coord)
-                except Exception as const_e: print(f"Warn: Const fail {name} {const_e}"); const = "N/A"
-                above_min = alts >= min_alt_deg; cont_dur_h = 0
-                if time_step_h > 0 and np.any(above_min):
-                    runs = np.split(np.arange(len(above_min)), np.where(np.diff(above_min))[0]+1); max_len = 0
-                    for run in runs:
-                        if run.size > 0 and above_min[run[0]]: max_len = max(max_len, len(run))
-                    cont_dur_h = max_len * time_step_h
-                result = {
-                    'Name': name, 'Type': type, 'Constellation': const, 'Magnitude': mag if not np.isnan(mag) else None,
-                    'Size (arcmin)': size if not np.isnan(size) else None, 'RA': ra, 'Dec': dec, 'Max Altitude (°)': peak_alt,
-                    'Azimuth at Max (°)': peak_az, 'Direction at Max': peak_dir, 'Time at Max (UTC)': peak_time,
-                    'Max Cont. Duration (h)': cont_dur_h, 'skycoord': coord, 'altitudes': alts, 'azimuths': azs, 'times': observing_times }
-                observable_objects.append(result)
-        except Exception as obj_e: print(t.get('error_processing_object', "Err proc {}: {}").format(obj.get('Name', f'Obj {index}'), obj_e))
-    return observable_objects
+    names, types, ras, decs = (catalog_df[col].to_numpy() for col in ('Name', 'Type', 'RA_str', 'Dec_str')) # Columns pulled out once as flat arrays (SoA), masked together below
+    mags = catalog_df['Mag'].to_numpy(dtype=float); sizes = catalog_df['MajAx'].to_numpy(dtype=float) if 'MajAx' in catalog_df.columns else np.full(len(names), np.nan)
+    coords = SkyCoord(ra=catalog_df['RA_deg'].to_numpy() * u.deg, dec=catalog_df['Dec_deg'].to_numpy() * u.deg) # Pre-parsed at load - no string parsing per search
+    try:
+        with erfa_astrom.set(ErfaAstromInterpolator(ERFA_INTERP_MIN * u.min)): altazs = coords[:, np.newaxis].transform_to(AltAz(obstime=observing_times[np.newaxis, :], location=observer_location))
+        all_alts = altazs.alt.to_value(u.deg); all_azs = altazs.az.to_value(u.deg) # Unitless float64 from here on
+    except Exception as trans_e: # The one batched step that can fail - reported once for the whole catalog slice
+        err_msg = t.get('error_processing_object', "Err proc {}: {}").format(f"{len(names)} objs", f"Transform err {trans_e}"); print(err_msg); messages.append(('warning', err_msg)); all_alts = None
+    if all_alts is not None:
+        obs_mask, peak_all, runs_all = _scan_peaks(all_alts, float(min_alt_deg))
+        near_margin = 15.05 * time_step_h / 2 # Altitude changes at most at the sidereal rate (~15 deg/h) - a peak between samples is at most half a step from one
+        obs_mask |= all_alts.max(axis=1) >= min_alt_deg - near_margin # Peaks just below min_alt on the grid: decided on the refined peak below
+        alts_o, azs_o = all_alts[obs_mask], all_azs[obs_mask]; coords_o = coords[obs_mask]
+        rows = np.arange(len(alts_o)); peak_idx = peak_all[obs_mask]; runs_o = runs_all[obs_mask]; durations = np.minimum(runs_o, len(observing_times) - 1) * time_step_h; peak_alts = alts_o[rows, peak_idx]; peak_azs = azs_o[rows, peak_idx]; peak_times = observing_times[peak_idx]
+        if len(alts_o) and len(observing_times) > 1: # Refine the peaks: one more batched transform on a small per-object grid around each coarse maximum
+            grid_jd = observing_times.jd; step_jd = grid_jd[1] - grid_jd[0]
+            fine_times = Time(np.clip(grid_jd[peak_idx][:, np.newaxis] + np.linspace(-step_jd, step_jd, PEAK_REFINE_SAMPLES), grid_jd[0], grid_jd[-1]), format='jd', scale='utc')
+            try:
+                with erfa_astrom.set(ErfaAstromInterpolator(ERFA_INTERP_MIN * u.min)): fine_altazs = coords_o[:, np.newaxis].transform_to(AltAz(obstime=fine_times, location=observer_location)) # (objects x samples) obstimes - interpolation saves one ERFA astrom setup per element
+                fine_alts = fine_altazs.alt.to_value(u.deg); fine_idx = fine_alts.argmax(axis=1)
+                peak_alts = fine_alts[rows, fine_idx]; peak_azs = fine_altazs.az.to_value(u.deg)[rows, fine_idx]; peak_times = fine_times[rows, fine_idx]
+                fine_jd = fine_times.jd; fine_runs = _scan_peaks(np.where(np.diff(fine_jd, axis=1, prepend=-np.inf) > 0, fine_alts, -np.inf), float(min_alt_deg))[2] # Samples clipped onto the window edge counted once
+                durations = np.where(runs_o > 0, durations, fine_runs * (2 * time_step_h / (PEAK_REFINE_SAMPLES - 1))) # The refined grid only times peaks the search grid missed
+            except Exception as refine_e: print(f"Warn: Peak refine fail, using search grid: {refine_e}")
+        peak_dirs = azimuths_to_directions(peak_azs); keep = ((runs_o > 0) | (peak_alts >= min_alt_deg)) & (peak_alts <= max_alt_deg)
+        if peak_direction is not None: keep &= peak_dirs == peak_direction
+        keep_idx = np.flatnonzero(keep)
+        try: consts = get_constellation(coords_o[keep_idx]) if len(keep_idx) else []
+        except Exception as const_e: print(f"Warn: Const fail {const_e}"); consts = ["N/A"] * len(keep_idx)
+        names_o, types_o, ras_o, decs_o, mags_o, sizes_o = (col[obs_mask] for col in (names, types, ras, decs, mags, sizes))
+        plot_alts, plot_azs = alts_o[keep_idx].astype(np.float32), azs_o[keep_idx].astype(np.float32) # Plot curves only: float32 halves what the session state and caches hold
+        for k, (j, const) in enumerate(zip(keep_idx, consts)):
+            mag, size = mags_o[j], sizes_o[j]
+            result = {
+                'Name': names_o[j], 'Type': types_o[j], 'Constellation': const, 'Magnitude': mag if not np.isnan(mag) else None,
+                'Size (arcmin)': size if not np.isnan(size) else None, 'RA': ras_o[j], 'Dec': decs_o[j], 'Max Altitude (°)': peak_alts[j],
+                'Azimuth at Max (°)': peak_azs[j], 'Direction at Max': peak_dirs[j], 'Time at Max (UTC)': peak_times[j],
+                'Max Cont. Duration (h)': durations[j], 'altitudes': plot_alts[k], 'azimuths': plot_azs[k], 'times': observing_times }
+            observable_objects.append(result)
+    return observable_objects, messages
+
+@st.cache_data(max_entries=8, show_spinner=False)
+def get_cached_observable_objects(lat: float, lon: float, height: float, times_jd: np.ndarray, min_alt_deg: float, max_alt_deg: float, peak_direction: str | None, filter_key: tuple, _catalog_df: pd.DataFrame, lang: str) -> tuple[list[dict], list[tuple[str, str]]]:
+    # Repeating a search (e.g. Find again after changing the sort order or list length) returns the stored result list
+    # The filtered frame is identified by filter_key (catalog path + filter values) - the leading underscore keeps Streamlit from hashing it
+    return find_observable_objects(_make_location(lat, lon, height), Time(times_jd, format='jd', scale='utc'), min_alt_deg, _catalog_df, lang, max_alt_deg, peak_direction)
 
 def get_local_time_str(utc_time: Time | None, timezone_str: str) -> tuple[str, str]:
     # (Unchanged)
@@ -247,12 +359,63 @@ def get_local_time_str(utc_time: Time | None, timezone_str: str) -> tuple[str, s
     if not isinstance(utc_time, Time): print(f"Err: utc_time type {type(utc_time)}"); return "N/A", "N/A"
     if not isinstance(timezone_str, str) or not timezone_str: print(f"Err: tz_str type {timezone_str}"); return "N/A", "N/A"
     try:
-        local_tz = pytz.timezone(timezone_str); utc_dt = utc_time.to_datetime(timezone.utc); local_dt = utc_dt.astimezone(local_tz)
+        local_tz = _get_timezone(timezone_str); utc_dt = utc_time.to_datetime(timezone.utc); local_dt = utc_dt.astimezone(local_tz)
         local_str = local_dt.strftime('%Y-%m-%d %H:%M:%S'); tz_name = local_dt.tzname(); tz_name = tz_name if tz_name else local_tz.zone
         return local_str, tz_name
     except pytz.exceptions.UnknownTimeZoneError: print(f"Err: Unknown TZ '{timezone_str}'."); return utc_time.to_datetime(timezone.utc).strftime('%Y-%m-%d %H:%M:%S'), "UTC (TZ Err)"
     except Exception as e: print(f"Err converting time: {e}"); traceback.print_exc(); return utc_time.to_datetime(timezone.utc).strftime('%Y-%m-%d %H:%M:%S'), "UTC (Conv Err)"
 
+def get_local_time_strs(utc_times: list[Time | None], timezone_str: str) -> list[tuple[str, str]]:
+    # Batch version of get_local_time_str: one vectorized pandas tz_convert for the whole list instead of a datetime round-trip per row
+    jds = np.array([ut.jd if isinstance(ut, Time) else np.nan for ut in utc_times], dtype=float)
+    try:
+        local_idx = pd.to_datetime(jds, unit='D', origin='julian', utc=True).tz_convert(_get_timezone(timezone_str))
+        local_strs = local_idx.strftime('%Y-%m-%d %H:%M:%S')
+        return [(s, dt.tzname()) if isinstance(s, str) else ("N/A", "N/A") for s, dt in zip(local_strs, local_idx)]
+    except Exception as e: print(f"Err batch time conv: {e}"); return [get_local_time_str(ut, timezone_str) for ut in utc_times] # Per-row path handles TZ errors
+
+def _csv_float(value, decimal: str) -> str:
+    return '' if value is None or value != value else repr(float(value)).replace('.', decimal) # NaN != NaN -> empty like None
+
+def _digest_key(values: tuple) -> bytes:
+    # Cache key for the export tuples: one C-level blake2b digest over their repr instead of Streamlit's recursive md5 hashing of every cell
+    return hashlib.blake2b(repr(values).encode('utf-8'), digest_size=16).digest()
+
+@st.cache_data(show_spinner=False, max_entries=16, hash_funcs={tuple: _digest_key})
+def build_results_csv(col_values: tuple[tuple, ...], columns: tuple[str, ...], float_cols: tuple[bool, ...], decimal: str, compress: bool = False) -> bytes:
+    # Keyed on the export columns themselves - reruns with unchanged results reuse the serialized CSV
+    # Rows go through the C csv.writer (minimal quoting, None -> empty) and are encoded in blocks of CSV_CHUNK_ROWS - no DataFrame, no full-size str copy
+    buf = io.BytesIO(); buf.write(codecs.BOM_UTF8) # BOM bytes written once so Excel detects UTF-8; everything after is plain utf-8
+    text = io.StringIO(); writer = csv.writer(text, delimiter=';', lineterminator='\n'); writer.writerow(columns)
+    n_rows = len(col_values[0]) if col_values else 0
+    for start in range(0, n_rows, CSV_CHUNK_ROWS):
+        block = (tuple(_csv_float(v, decimal) for v in vals[start:start + CSV_CHUNK_ROWS]) if is_float else vals[start:start + CSV_CHUNK_ROWS] for vals, is_float in zip(col_values, float_cols)) # Only float columns are pre-formatted (locale decimal, NaN -> empty)
+        writer.writerows(zip(*block)); buf.write(text.getvalue().encode('utf-8')); text.seek(0); text.truncate()
+    buf.write(text.getvalue().encode('utf-8')) # Header of an empty export
+    return gzip.compress(buf.getvalue()) if compress else buf.getvalue() # Cached compressed, so the gzip pass also runs once per result set
+
+@functools.lru_cache(maxsize=8)
+def _csv_filename_parts(lang: str) -> tuple[str, str, str]:
+    # File-name template split around its '{}' once per language; the stamp is then just concatenated
+    return get_translation(lang).get('results_csv_filename', "dso_list_{}.csv").partition('{}')
+
+@functools.lru_cache(maxsize=32)
+def get_csv_download_labels(lang: str, stamp: str, compress: bool = False) -> tuple[str, str]:
+    # (button label, file name) per language and minute stamp - built once, not on every fragment rerun
+    t = get_translation(lang); head, _, tail = _csv_filename_parts(lang); csv_fn = head + stamp + tail
+    return t.get('results_save_csv_button', "💾 Save CSV"), csv_fn + '.gz' if compress else csv_fn
+
+def export_results_csv(results_data: list[dict], timezone_str: str, lang: str, compress: bool = False) -> bytes:
+    t = get_translation(lang); loc_times_csv = get_local_time_strs([obj.get('Time at Max (UTC)') for obj in results_data], timezone_str)
+    export_cols = (t.get('results_export_name',"Name"), t.get('results_export_type',"Type"), t.get('results_export_constellation',"Const"), t.get('results_export_mag',"Mag"),
+        t.get('results_export_size',"Size'"), t.get('results_export_ra',"RA"), t.get('results_export_dec',"Dec"), t.get('results_export_max_alt',"MaxAlt"),
+        t.get('results_export_az_at_max',"Az@Max"), t.get('results_export_direction_at_max',"Dir@Max"), t.get('results_export_time_max_utc',"TimeMaxUTC"),
+        t.get('results_export_time_max_local',"TimeMaxLoc"), t.get('results_export_cont_duration',"Dur(h)")) # Header labels looked up once, not per row
+    export_vals = tuple(tuple(obj.get(k) for obj in results_data) for k in EXPORT_RESULT_KEYS) + ( # Column-major: one tuple per CSV column
+        tuple(peak_utc.iso if (peak_utc := obj.get('Time at Max (UTC)')) else 'N/A' for obj in results_data), tuple(loc_t for loc_t, _ in loc_times_csv),
+        tuple(obj.get('Max Cont. Duration (h)') for obj in results_data))
+    return build_results_csv(export_vals, export_cols, EXPORT_FLOAT_COLUMNS, ',' if lang == 'de' else '.', compress)
+
 # --- Redshift Calculation Functions ---
 def hubble_parameter_inv_integrand(z, omega_m, omega_lambda):
   # (Unchanged)
@@ -332,9 +495,14 @@ def get_comoving_comparison_key(mpc):
     return "example_comoving_cmb"
 
 # --- Plotting Function ---
-def create_plot(plot_data: dict, min_altitude_deg: float, max_altitude_deg: float, plot_type: str, lang: str) -> plt.Figure | None:
-    # (Unchanged)
-    t = get_translation(lang); fig = None
+@functools.lru_cache(maxsize=1)
+def _pyplot():
+    # matplotlib is imported on the first plot, not at app start (~250 ms); Agg because figures are only rendered server-side - never probe for a GUI toolkit
+    import matplotlib; matplotlib.use('Agg'); import matplotlib.pyplot as plt; import matplotlib.dates as mdates; plt.ioff()
+    return plt, mdates
+
+def create_plot(plot_data: dict, min_altitude_deg: float, max_altitude_deg: float, plot_type: str, lang: str) -> Figure | None:
+    t = get_translation(lang); fig = None; plt, mdates = _pyplot()
     try:
         if not isinstance(plot_data, dict): st.error("Plot Err: Invalid data."); return None
         times, alts, azs = plot_data.get('times'), plot_data.get('altitudes'), plot_data.get('azimuths')
@@ -343,7 +511,7 @@ def create_plot(plot_data: dict, min_altitude_deg: float, max_altitude_deg: floa
         if plot_type == 'Sky Path' and not isinstance(azs, np.ndarray): st.error("Plot Err: Invalid azs."); return None
         if len(times) != len(alts) or (azs is not None and len(times) != len(azs)): st.error("Plot Err: Mismatch arrays."); return None
         if len(times) < 1: st.error("Plot Err: No data."); return None
-        plot_times = times.plot_date
+        plot_times = times.plot_date # Matplotlib day numbers for the whole array in one conversion - both plot types work from these
         try: is_dark = (st.get_option("theme.base") == "dark")
         except Exception: is_dark = False
         plt.style.use('dark_background' if is_dark else 'default')
@@ -361,7 +529,7 @@ def create_plot(plot_data: dict, min_altitude_deg: float, max_altitude_deg: floa
             if azs is None: st.error("Plot Err: Azimuths needed."); plt.close(fig); return None
             ax.remove(); ax = fig.add_subplot(111, projection='polar', facecolor=face_col)
             az_rad = np.deg2rad(azs); radius = 90 - alts
-            time_delta = times.jd.max() - times.jd.min(); time_norm = (times.jd - times.jd.min()) / (time_delta + 1e-9); colors = plt.cm.plasma(time_norm)
+            pt_min = plot_times.min(); time_norm = (plot_times - pt_min) / (plot_times.max() - pt_min + 1e-9); colors = plt.cm.plasma(time_norm)
             scatter = ax.scatter(az_rad, radius, c=colors, s=15, alpha=0.8, edgecolors='none', label=name)
             ax.plot(az_rad, radius, color=prim_col, alpha=0.4, lw=0.8)
             ax.plot(np.linspace(0, 2*np.pi, 100), np.full(100, 90 - min_altitude_deg), color=min_col, ls='--', lw=1.2, label=t.get('graph_min_altitude_label', "Min Alt ({:.0f}°)").format(min_altitude_deg), alpha=0.8)
@@ -370,7 +538,7 @@ def create_plot(plot_data: dict, min_altitude_deg: float, max_altitude_deg: floa
             ax.set(ylim=(0, 90), title=t.get('graph_title_sky_path', "Sky Path for {}").format(name)); ax.title.set(va='bottom', color=title_col, fontsize=13, weight='bold', y=1.1)
             try:
                 cbar = fig.colorbar(scatter, ax=ax, label="Time (UTC)", pad=0.1, shrink=0.7)
-                start_lbl, end_lbl = (times[0].to_datetime(timezone.utc).strftime('%H:%M'), times[-1].to_datetime(timezone.utc).strftime('%H:%M')) if len(times)>0 else ('Start', 'End')
+                start_lbl, end_lbl = (dt.strftime('%H:%M') for dt in mdates.num2date(plot_times[[0, -1]], tz=timezone.utc)) # From the day numbers already computed - no second Time conversion
                 cbar.set_ticks([0, 1]); cbar.ax.set_yticklabels([start_lbl, end_lbl])
                 cbar.set_label("Time (UTC)", color=lbl_col, fontsize=10); cbar.ax.yaxis.set_tick_params(color=lbl_col, labelsize=9)
                 plt.setp(plt.getp(cbar.ax.axes, 'yticklabels'), color=lbl_col); cbar.outline.set_edgecolor(spine_col); cbar.outline.set_linewidth(0.5)
@@ -383,6 +551,152 @@ def create_plot(plot_data: dict, min_altitude_deg: float, max_altitude_deg: floa
         return fig
     except Exception as e: st.error(f"Plot Err: Unexpected: {e}"); traceback.print_exc(); plt.close(fig); return None
 
+def _figure_png(fig: Figure | None) -> bytes | None:
+    # Rasterize once with st.pyplot's own settings (tight bbox, 200 dpi), then free the figure
+    if fig is None: return None
+    buf = io.BytesIO(); fig.savefig(buf, format='png', bbox_inches='tight', dpi=200); _pyplot()[0].close(fig)
+    return buf.getvalue()
+
+@st.cache_data(max_entries=32, show_spinner=False)
+def get_cached_plot(name: str, times_jd: np.ndarray, alts: np.ndarray, azs: np.ndarray | None, min_altitude_deg: float, max_altitude_deg: float, plot_type: str, is_dark: bool, lang: str) -> bytes | None:
+    # Re-opening a plot reuses the rendered PNG; is_dark is only part of the key (create_plot reads the theme itself)
+    # Cached as PNG bytes, not a Figure - a hit skips both unpickling the figure and st.pyplot's savefig
+    return _figure_png(create_plot({'Name': name, 'times': Time(times_jd, format='jd', scale='utc'), 'altitudes': alts, 'azimuths': azs}, min_altitude_deg, max_altitude_deg, plot_type, lang))
+
+def create_plot_for(plot_data: dict, min_altitude_deg: float, max_altitude_deg: float, plot_type: str, lang: str) -> bytes | None:
+    # Cache front-end for create_plot: hashes plain arrays instead of the Time object / result dict
+    if not isinstance(plot_data, dict) or not isinstance(plot_data.get('times'), Time) or not isinstance(plot_data.get('altitudes'), np.ndarray):
+        return _figure_png(create_plot(plot_data, min_altitude_deg, max_altitude_deg, plot_type, lang)) # Let create_plot report bad input
+    try: is_dark = (st.get_option("theme.base") == "dark")
+    except Exception: is_dark = False
+    return get_cached_plot(plot_data.get('Name', 'Object'), plot_data['times'].jd, plot_data['altitudes'], plot_data.get('azimuths'), min_altitude_deg, max_altitude_deg, plot_type, is_dark, lang)
+
+def _open_result_plot(index: int, obj_data: dict): st.session_state.update({'plot_object_index': index, 'active_result_plot_data': obj_data, 'show_plot': True, 'show_custom_plot': False, 'expanded_object_index': index}) # Row index into last_results, reset with every search
+
+# Session-state resets applied with a single update() each
+_PLOT_RESET = {'show_plot': False, 'active_result_plot_data': None, 'expanded_object_index': None}
+_CUSTOM_PLOT_RESET = {'show_custom_plot': False, 'custom_target_plot_data': None}
+
+def _close_result_plot(): st.session_state.update(_PLOT_RESET)
+
+def _close_custom_plot(): st.session_state.update(_CUSTOM_PLOT_RESET)
+
+def _show_plot_pane(plot_data: dict, close_key: str, on_close, t: dict, lang: str):
+    # Shared by the result and custom-target plots: render (cached), report failure, close button
+    with st.spinner(t.get('results_spinner_plotting', "Plotting...")):
+        try: png = create_plot_for(plot_data, st.session_state.min_alt_slider, st.session_state.max_alt_slider, st.session_state.plot_type_selection, lang); plt_e = None # Reports its own errors, None on failure
+        except (ValueError, RuntimeError) as e: png, plt_e = None, e # Rasterizing (savefig) failed
+    if plt_e is not None: st.error(t.get('results_graph_error', "Plot Err: {}").format(plt_e))
+    elif not png: st.error(t.get('results_graph_not_created', "Plot fail.")); return
+    else: st.image(png)
+    st.button(t.get('results_close_graph_button', "Close Plot"), key=close_key, on_click=on_close)
+
+@st.fragment
+def render_results(observer_for_run: Observer | None, lang: str):
+    # Results list + custom target: plot/close clicks and the graph-type radio rerun only this fragment, not the search page
+    t = get_translation(lang)
+    # Display Results Block
+    if st.session_state.last_results:
+        results_data = st.session_state.last_results
+        st.subheader(t.get('results_list_header', "Results"))
+        # Moon Phase Display
+        win_start, win_end = st.session_state.get('window_start_time'), st.session_state.get('window_end_time'); obs_exists = observer_for_run is not None
+        if obs_exists and isinstance(win_start, Time) and isinstance(win_end, Time):
+            illum = st.session_state.window_moon_illum; moon_pct = -1; moon_svg = None # Set together with the window by the cached window pass - None only if it failed there (logged)
+            if illum is None: st.info(t.get('moon_phase_unavailable', "Moon phase N/A."))
+            else:
+                try: moon_pct = illum*100; moon_svg = create_moon_phase_svg(illum, 50); m_c1, m_c2 = st.columns([1,3])
+                except Exception as moon_e: st.warning(t.get('moon_phase_error', "Moon Err: {}").format(moon_e)); moon_pct = -1; moon_svg = None
+            if moon_svg: m_c1.markdown(moon_svg, unsafe_allow_html=True)
+            if moon_pct >= 0:
+                 with m_c2:
+                    st.metric(label=t.get('moon_metric_label', "Moon Illum."), value=f"{moon_pct:.0f}%")
+                    moon_thresh = st.session_state.moon_phase_slider
+                    if moon_pct > moon_thresh: st.warning(t.get('moon_warning_message', "Warn: Moon > ({:.0f}%)!").format(moon_pct, moon_thresh))
+        elif st.session_state.find_button_pressed: st.info(t.get('moon_phase_unavailable', "Moon phase N/A."))
+        # Plot Type Selection
+        plot_opts = {'Sky Path': t.get('graph_type_sky_path', "Sky Path"), 'Altitude Plot': t.get('graph_type_alt_time', "Alt Plot")}
+        st.radio(t.get('graph_type_label', "Graph:"), options=PLOT_TYPE_KEYS, format_func=lambda k: plot_opts[k], key='plot_type_selection', horizontal=True)
+        # Object List Display
+        loc_times_disp = get_local_time_strs([obj.get('Time at Max (UTC)') for obj in results_data], st.session_state.selected_timezone) # One batch conversion for all rows
+        # Row labels looked up once per render instead of once per result row; templates bound as their .format methods
+        title_fmt = t.get('results_expander_title', "{} ({}) - Mag: {}").format; details_hdr = t.get('results_coords_header', "**Details:**"); const_lbl = t.get('results_export_constellation', 'Const')
+        size_lbl = t.get('results_size_label', 'Size:'); size_fmt = t.get('results_size_value', "{:.1f}'").format; max_alt_hdr = t.get('results_max_alt_header', "**Max Alt:**")
+        az_fmt = t.get('results_azimuth_label', "(Az: {:.1f}°{})").format; dir_fmt = t.get('results_direction_label', ", Dir: {}").format; best_time_hdr = t.get('results_best_time_header', "**Best Time (Local):**")
+        dur_hdr = t.get('results_cont_duration_header', "**Duration:**"); dur_fmt = t.get('results_duration_value', "{:.1f} hrs").format; google_lbl = t.get('google_link_text', 'Google'); simbad_lbl = t.get('simbad_link_text', 'SIMBAD')
+        plot_btn_lbl = t.get('results_graph_button', "📈 Plot")
+        for i, obj_data in enumerate(results_data):
+            name, type = obj_data.get('Name','N/A'), obj_data.get('Type','N/A')
+            obj_mag = obj_data.get('Magnitude')
+            mag_s = f"{obj_mag:.1f}" if obj_mag is not None else "N/A"
+            title = title_fmt(name, type, mag_s)
+            is_exp = (st.session_state.expanded_object_index == i)
+            obj_cont = st.container()
+            with obj_cont.expander(title, expanded=is_exp):
+                c1, c2, c3 = st.columns([2,2,1])
+                # Col 1: Details (one markdown element per column - paragraphs instead of a separate element per line)
+                size = obj_data.get('Size (arcmin)')
+                c1.markdown(f"{details_hdr}\n\n**{const_lbl}:** {obj_data.get('Constellation', 'N/A')}\n\n**{size_lbl}** {size_fmt(size) if size is not None else 'N/A'}\n\n**RA:** {obj_data.get('RA', 'N/A')}\n\n**Dec:** {obj_data.get('Dec', 'N/A')}")
+                # Col 2: Visibility
+                max_a = obj_data.get('Max Altitude (°)', 0); az_m = obj_data.get('Azimuth at Max (°)', 0); dir_m = obj_data.get('Direction at Max', 'N/A')
+                # === KORREKTUR HIER ===
+                # Format Azimuth (assume localization.py has 'results_azimuth_label': "(Az: {:.1f}°{})" or similar)
+                # Provide dummy second arg "" to avoid IndexError if localization wasn't fixed
+                az_str = az_fmt(az_m, "") if isinstance(az_m, (int, float)) else "(Az: N/A)"
+                # Format Direction
+                dir_str = dir_fmt(dir_m)
+                # =======================
+                loc_t, loc_tz = loc_times_disp[i]; dur = obj_data.get('Max Cont. Duration (h)', 0)
+                c2.markdown(f"{max_alt_hdr}\n\n**{max_a:.1f}°** {az_str}{dir_str}\n\n{best_time_hdr}\n\n{loc_t} ({loc_tz})\n\n{dur_hdr}\n\n{dur_fmt(dur)}")
+                # Col 3: Links & Plot
+                g_q = urllib.parse.quote_plus(f"{name} astronomy"); g_url = f"https://www.google.com/search?q={g_q}"
+                s_q = urllib.parse.quote_plus(name); s_url = f"http://simbad.u-strasbg.fr/simbad/sim-basic?Ident={s_q}"; c3.markdown(f"[{google_lbl}]({g_url})\n\n[{simbad_lbl}]({s_url})", unsafe_allow_html=True)
+                plot_key = f"plot_{name}_{i}"
+                st.button(plot_btn_lbl, key=plot_key, on_click=_open_result_plot, args=(i, obj_data))
+                # Plot Display Area
+                if st.session_state.show_plot and st.session_state.plot_object_index == i:
+                    st.markdown("---"); _show_plot_pane(st.session_state.active_result_plot_data, f"close_{name}_{i}", _close_result_plot, t, lang)
+        # CSV Export (only reached with a non-empty result list)
+        csv_gz = st.checkbox(t.get('results_csv_gzip_checkbox', "Compress CSV (.csv.gz)"), key='csv_gzip') # Several times smaller download for long lists
+        csv_ph = st.empty(); csv_lbl, csv_fn = get_csv_download_labels(lang, st.session_state.csv_file_stamp or datetime.now().strftime("%Y%m%d_%H%M"), csv_gz)
+        csv_data = functools.partial(export_results_csv, results_data, st.session_state.selected_timezone, lang, csv_gz) # Built on click where Streamlit supports callable data
+        if not DOWNLOAD_DATA_CALLABLE:
+            try: csv_data = csv_data()
+            except (ValueError, TypeError, UnicodeEncodeError) as csv_e: csv_data = None; csv_ph.error(t.get('results_csv_export_error', "CSV Err: {}").format(csv_e))
+        if csv_data is not None: csv_ph.download_button(label=csv_lbl, data=csv_data, file_name=csv_fn, mime='application/gzip' if csv_gz else 'text/csv', key='csv_dl')
+    elif st.session_state.find_button_pressed: st.info(t.get('warning_no_objects_found', "No objects found..."))
+
+    # Custom Target Plotting
+    st.markdown("---")
+    with st.expander(t.get('custom_target_expander', "Plot Custom Target")):
+        with st.form("custom_form"):
+             st.text_input(t.get('custom_target_ra_label', "RA:"), key="custom_target_ra", placeholder=t.get('custom_target_ra_placeholder', "..."))
+             st.text_input(t.get('custom_target_dec_label', "Dec:"), key="custom_target_dec", placeholder=t.get('custom_target_dec_placeholder', "..."))
+             st.text_input(t.get('custom_target_name_label', "Name (Opt):"), key="custom_target_name", placeholder="My Comet")
+             custom_submitted = st.form_submit_button(t.get('custom_target_button', "Create Plot"))
+        custom_err_ph = st.empty(); custom_plot_ph = st.empty()
+        if custom_submitted: # Process custom plot
+             st.session_state.update({**_PLOT_RESET, **_CUSTOM_PLOT_RESET, 'custom_target_error': ""})
+             cust_ra, cust_dec = st.session_state.custom_target_ra, st.session_state.custom_target_dec; cust_name = st.session_state.custom_target_name or t.get('custom_target_name_label', "Target").replace(":", "")
+             win_s_c, win_e_c = st.session_state.get('window_start_time'), st.session_state.get('window_end_time'); obs_ex_c = observer_for_run is not None
+             if not cust_ra or not cust_dec: st.session_state.custom_target_error = t.get('custom_target_error_coords', "Invalid RA/Dec."); custom_err_ph.error(st.session_state.custom_target_error)
+             elif not obs_ex_c or not isinstance(win_s_c, Time) or not isinstance(win_e_c, Time): st.session_state.custom_target_error = t.get('custom_target_error_window', "Invalid window/loc."); custom_err_ph.error(st.session_state.custom_target_error)
+             else: # Proceed
+                 try:
+                     cust_coord = SkyCoord(ra=cust_ra, dec=cust_dec, unit=(u.hourangle, u.deg))
+                     if not win_s_c < win_e_c: raise ValueError("Invalid time window.")
+                     altaz_fr_c = get_custom_altaz_frame(observer_for_run, win_s_c.jd, win_e_c.jd); obs_times_c = altaz_fr_c.obstime
+                     if len(obs_times_c) < 2: raise ValueError("Time window too short.")
+                     cust_altazs = cust_coord.transform_to(altaz_fr_c)
+                     cust_plot_data = {'Name': cust_name, 'altitudes': cust_altazs.alt.to_value(u.deg), 'azimuths': cust_altazs.az.to_value(u.deg), 'times': obs_times_c}
+                     st.session_state.update({'custom_target_plot_data': cust_plot_data, 'show_custom_plot': True, 'custom_target_error': ""}) # Rendered below in this same run
+                 except ValueError as cust_coord_e: st.session_state.custom_target_error = f"{t.get('custom_target_error_coords', 'Invalid RA/Dec.')} ({cust_coord_e})"; custom_err_ph.error(st.session_state.custom_target_error)
+                 except Exception as cust_e: st.session_state.custom_target_error = f"Custom plot err: {cust_e}"; custom_err_ph.error(st.session_state.custom_target_error); traceback.print_exc()
+        # Display custom plot if exists
+        if st.session_state.show_custom_plot and st.session_state.custom_target_plot_data:
+            with custom_plot_ph.container(): st.markdown("---"); _show_plot_pane(st.session_state.custom_target_plot_data, "close_custom", _close_custom_plot, t, lang)
+        elif st.session_state.custom_target_error: custom_err_ph.error(st.session_state.custom_target_error)
+
 # --- Main App ---
 def main():
     initialize_session_state()
@@ -390,15 +704,12 @@ def main():
     # Get Language and Translations
     lang = st.session_state.language
     t = get_translation(lang)
-    actual_lang_keys = ['de', 'en', 'fr']
-    if lang not in actual_lang_keys:
+    if lang not in LANGUAGE_INDEX:
         print(f"Info: Invalid lang '{lang}' in state, reset to 'de'.")
         st.session_state.language = 'de'; lang = 'de'; t = get_translation(lang)
 
     # Load Catalog Data
-    @st.cache_data
-    def cached_load_ongc_data(path, current_lang): return load_ongc_data(path, current_lang)
-    df_catalog_data = cached_load_ongc_data(CATALOG_FILEPATH, lang)
+    df_catalog_data = load_ongc_data(CATALOG_FILEPATH, lang)
 
     st.title("Advanced DSO Finder")
 
@@ -421,25 +732,20 @@ def main():
         if st.session_state.catalog_status_msg != msg: msg_func(msg); st.session_state.catalog_status_msg = msg
 
         # Language Selector
-        lang_opts = {'de': 'Deutsch', 'en': 'English', 'fr': 'Français'}; lang_keys = list(lang_opts.keys())
-        curr_idx = lang_keys.index(lang) if lang in lang_keys else 0
-        sel_key = st.radio(t.get('language_select_label', "Language"), options=lang_keys, format_func=lang_opts.get, key='language_radio', index=curr_idx, horizontal=True)
-        if sel_key != st.session_state.language: st.session_state.language = sel_key; st.session_state.location_search_status_msg = ""; st.rerun()
+        st.radio(t.get('language_select_label', "Language"), options=LANGUAGE_KEYS, format_func=LANGUAGE_NAMES.get, key='language_radio', index=LANGUAGE_INDEX.get(lang, 0), horizontal=True, on_change=_on_language_change)
 
         # Location Settings
         with st.expander(t.get('location_expander', "📍 Location"), expanded=True):
             loc_opts_map = {'Search': t.get('location_option_search', "Search"), 'Manual': t.get('location_option_manual', "Manual")}
-            st.radio(t.get('location_select_label', "Method"), options=list(loc_opts_map.keys()), format_func=lambda k: loc_opts_map[k], key="location_choice_key", horizontal=True)
+            st.radio(t.get('location_select_label', "Method"), options=LOCATION_KEYS, format_func=lambda k: loc_opts_map[k], key="location_choice_key", horizontal=True)
             lat_val, lon_val, h_val, loc_valid_tz, curr_loc_valid = None, None, None, False, False
             if st.session_state.location_choice_key == "Manual":
                 st.number_input(t.get('location_lat_label', "Lat (°N)"), -90.0, 90.0, step=0.01, format="%.4f", key="manual_lat_val")
                 st.number_input(t.get('location_lon_label', "Lon (°E)"), -180.0, 180.0, step=0.01, format="%.4f", key="manual_lon_val")
                 st.number_input(t.get('location_elev_label', "Elev (m)"), -500, step=10, format="%d", key="manual_height_val")
-                lat_val, lon_val, h_val = st.session_state.manual_lat_val, st.session_state.manual_lon_val, st.session_state.manual_height_val
-                if isinstance(lat_val, (int, float)) and isinstance(lon_val, (int, float)) and isinstance(h_val, (int, float)):
-                    loc_valid_tz, curr_loc_valid = True, True; st.session_state.location_is_valid_for_run = True
-                    if st.session_state.location_search_success: st.session_state.update({'location_search_success': False, 'searched_location_name': None, 'location_search_status_msg': ""})
-                else: st.warning(t.get('location_error_manual_none', "Manual fields invalid.")); curr_loc_valid = False; st.session_state.location_is_valid_for_run = False
+                try: lat_val, lon_val, h_val = float(st.session_state.manual_lat_val), float(st.session_state.manual_lon_val), float(st.session_state.manual_height_val); loc_valid_tz, curr_loc_valid = True, True
+                except (TypeError, ValueError): lat_val, lon_val, h_val = None, None, None; st.warning(t.get('location_error_manual_none', "Manual fields invalid.")); curr_loc_valid = False # Empty number_input gives None
+                if curr_loc_valid and st.session_state.location_search_success: st.session_state.update({'location_search_success': False, 'searched_location_name': None, 'location_search_status_msg': ""})
             elif st.session_state.location_choice_key == "Search":
                 with st.form("loc_search_form"):
                     st.text_input(t.get('location_search_label', "Loc Name:"), key="location_search_query", placeholder=t.get('location_search_placeholder', "..."))
@@ -448,17 +754,17 @@ def main():
                 status_ph = st.empty()
                 if st.session_state.location_search_status_msg: (status_ph.success if st.session_state.location_search_success else status_ph.error)(st.session_state.location_search_status_msg)
                 if submitted and st.session_state.location_search_query:
-                    loc, svc, err = None, None, None; query = st.session_state.location_search_query; agent = f"AdvDSO/{random.randint(1000,9999)}"
+                    loc, svc, err = None, None, None; query = st.session_state.location_search_query
                     # Hinweis: Die Geocoding-Suche kann langsam sein wegen externer Dienste & Timeouts.
                     with st.spinner(t.get('spinner_geocoding', "Searching...")):
                         # Geocoding try/except chain (timeouts: N:10s, A:15s, P:15s)
-                        try: print("Try Nomi..."); geo = Nominatim(user_agent=agent, timeout=10); loc = geo.geocode(query); svc = "Nominatim" if loc else None; print(f"Nomi: {svc}")
+                        try: print("Try Nomi..."); geo = Nominatim(user_agent=GEOCODER_USER_AGENT, timeout=10); loc = geo.geocode(query); svc = "Nominatim" if loc else None; print(f"Nomi: {svc}")
                         except (GeocoderTimedOut, GeocoderServiceError, Exception) as e_n: print(f"Nomi fail: {e_n}"); status_ph.info(t.get('location_search_info_fallback', "...")); err = e_n
                         if not loc:
                             try: print("Try Arc..."); geo_a = ArcGIS(timeout=15); loc = geo_a.geocode(query); svc = "ArcGIS" if loc else None; print(f"Arc: {svc}")
                             except (GeocoderTimedOut, GeocoderServiceError, Exception) as e_a: print(f"Arc fail: {e_a}"); status_ph.info(t.get('location_search_info_fallback2', "...")); err = e_a if not err else err
                         if not loc:
-                            try: print("Try Phot..."); geo_p = Photon(user_agent=agent, timeout=15); loc = geo_p.geocode(query); svc = "Photon" if loc else None; print(f"Phot: {svc}")
+                            try: print("Try Phot..."); geo_p = Photon(user_agent=GEOCODER_USER_AGENT, timeout=15); loc = geo_p.geocode(query); svc = "Photon" if loc else None; print(f"Phot: {svc}")
                             except (GeocoderTimedOut, GeocoderServiceError, Exception) as e_p: print(f"Phot fail: {e_p}"); err = e_p if not err else err
                         # Process result
                         if loc and svc:
@@ -469,7 +775,7 @@ def main():
                             st.session_state.location_search_status_msg = f"{t.get(f_key, 'Found: {}').format(f_name)}\n({coord_str})"
                             status_ph.success(st.session_state.location_search_status_msg)
                             lat_val, lon_val, h_val = f_lat, f_lon, st.session_state.manual_height_val
-                            loc_valid_tz, curr_loc_valid = True, True; st.session_state.location_is_valid_for_run = True
+                            loc_valid_tz, curr_loc_valid = True, True
                         else: # Fail
                             st.session_state.update({'location_search_success': False, 'searched_location_name': None})
                             if err:
@@ -479,12 +785,13 @@ def main():
                                 st.session_state.location_search_status_msg = t.get(e_key, "Geo Err: {}").format(fmt_arg) if fmt_arg else t.get(e_key, "Geo Err")
                             else: st.session_state.location_search_status_msg = t.get('location_search_error_not_found', "Not found.")
                             status_ph.error(st.session_state.location_search_status_msg)
-                            curr_loc_valid = False; st.session_state.location_is_valid_for_run = False
+                            curr_loc_valid = False
                 elif st.session_state.location_search_success: # Use stored success
                     lat_val, lon_val, h_val = st.session_state.manual_lat_val, st.session_state.manual_lon_val, st.session_state.manual_height_val
-                    loc_valid_tz, curr_loc_valid = True, True; st.session_state.location_is_valid_for_run = True
+                    loc_valid_tz, curr_loc_valid = True, True
                     status_ph.success(st.session_state.location_search_status_msg)
-                else: curr_loc_valid = False; st.session_state.location_is_valid_for_run = False
+                else: curr_loc_valid = False
+            st.session_state.location_is_valid_for_run = curr_loc_valid # One session-state write covering every branch above
             st.markdown("---") # Timezone display
             tz_msg = "";
             if loc_valid_tz and lat_val is not None and lon_val is not None:
@@ -492,7 +799,7 @@ def main():
                     try: f_tz = tf.timezone_at(lng=lon_val, lat=lat_val)
                     except Exception as tz_e: print(f"TF err: {tz_e}"); f_tz = None
                     if f_tz:
-                        try: pytz.timezone(f_tz); st.session_state.selected_timezone = f_tz; tz_msg = f"{t.get('timezone_auto_set_label', 'TZ:')} **{f_tz}**"
+                        try: _get_timezone(f_tz); st.session_state.selected_timezone = f_tz; tz_msg = f"{t.get('timezone_auto_set_label', 'TZ:')} **{f_tz}**"
                         except pytz.UnknownTimeZoneError: st.session_state.selected_timezone = 'UTC'; tz_msg = f"{t.get('timezone_auto_fail_label', 'TZ:')} **UTC** (Invalid: {f_tz})"
                     else: st.session_state.selected_timezone = 'UTC'; tz_msg = f"{t.get('timezone_auto_fail_label', 'TZ:')} **UTC** ({t.get('timezone_auto_fail_msg', 'Failed')})"
                 else: tz_msg = f"{t.get('timezone_auto_fail_label', 'TZ:')} **{INITIAL_TIMEZONE}** (Auto N/A)"; st.session_state.selected_timezone = INITIAL_TIMEZONE
@@ -502,14 +809,14 @@ def main():
         # Time Settings
         with st.expander(t.get('time_expander', "⏱️ Time"), expanded=False):
             time_opts = {'Now': t.get('time_option_now', "Now"), 'Specific': t.get('time_option_specific', "Specific")}
-            st.radio(t.get('time_select_label', "Time"), options=list(time_opts.keys()), format_func=lambda k: time_opts[k], key="time_choice_exp", horizontal=True)
+            st.radio(t.get('time_select_label', "Time"), options=TIME_KEYS, format_func=lambda k: time_opts[k], key="time_choice_exp", horizontal=True)
             if st.session_state.time_choice_exp == "Now": st.caption(f"UTC: {Time.now().iso}")
             else: st.date_input(t.get('time_date_select_label', "Date:"), value=st.session_state.selected_date_widget, key='selected_date_widget')
 
         # Filter Settings
         with st.expander(t.get('filters_expander', "✨ Filters"), expanded=False):
             st.markdown(t.get('mag_filter_header', "**Mag Filter**")); mag_opts = {'Bortle Scale': t.get('mag_filter_option_bortle', "Bortle"), 'Manual': t.get('mag_filter_option_manual', "Manual")}
-            st.radio(t.get('mag_filter_method_label', "Method:"), options=list(mag_opts.keys()), format_func=lambda k: mag_opts[k], key="mag_filter_mode_exp", horizontal=True)
+            st.radio(t.get('mag_filter_method_label', "Method:"), options=MAG_FILTER_KEYS, format_func=lambda k: mag_opts[k], key="mag_filter_mode_exp", horizontal=True)
             st.slider(t.get('mag_filter_bortle_label', "Bortle:"), 1, 9, key='bortle_slider', help=t.get('mag_filter_bortle_help', "..."))
             if st.session_state.mag_filter_mode_exp == "Manual":
                 st.slider(t.get('mag_filter_min_mag_label', "Min:"), -5.0, 20.0, step=0.5, format="%.1f", help=t.get('mag_filter_min_mag_help', "..."), key='manual_min_mag_slider')
@@ -523,7 +830,7 @@ def main():
             st.markdown("---"); st.markdown(t.get('moon_warning_header', "**Moon**")); st.slider(t.get('moon_warning_label', "Warn > (%):"), 0, 100, key='moon_phase_slider', step=5)
             st.markdown("---"); st.markdown(t.get('object_types_header', "**Types**")); all_types = []
             if df_catalog_data is not None and 'Type' in df_catalog_data.columns:
-                try: all_types = sorted(list(df_catalog_data['Type'].dropna().astype(str).unique()))
+                try: all_types = get_catalog_types(CATALOG_FILEPATH, df_catalog_data)
                 except Exception as e: st.warning(f"{t.get('object_types_error_extract', 'Type Err')}: {e}")
             if all_types:
                 sel = [s for s in st.session_state.object_type_filter_exp if s in all_types];
@@ -561,7 +868,7 @@ def main():
             if cl_def != def_num: st.session_state.num_objects_slider = cl_def
             st.slider(t.get('results_options_max_objects_label', "Max Objs:"), min_sl, act_max, step=1, key='num_objects_slider', disabled=sl_dis)
             sort_opts = {'Duration & Altitude': t.get('results_options_sort_duration', "Duration"), 'Brightness': t.get('results_options_sort_magnitude', "Brightness")}
-            st.radio(t.get('results_options_sort_method_label', "Sort By:"), options=list(sort_opts.keys()), format_func=lambda k: sort_opts[k], key='sort_method', horizontal=True)
+            st.radio(t.get('results_options_sort_method_label', "Sort By:"), options=SORT_KEYS, format_func=lambda k: sort_opts[k], key='sort_method', horizontal=True)
 
         # Bug Report Button
         st.sidebar.markdown("---"); bug_email="debrun2005@gmail.com"; bug_subj=urllib.parse.quote("Bug Report: Adv DSO Finder")
@@ -576,7 +883,7 @@ def main():
     if st.session_state.location_is_valid_for_run: # Create observer if valid
         lat, lon, h, tz = st.session_state.manual_lat_val, st.session_state.manual_lon_val, st.session_state.manual_height_val, st.session_state.selected_timezone
         try:
-            observer_for_run = Observer(latitude=lat*u.deg, longitude=lon*u.deg, elevation=h*u.m, timezone=tz)
+            observer_for_run = get_observer(lat, lon, h, tz)
             if st.session_state.location_choice_key == "Manual": loc_disp = t.get('location_manual_display', "Manual ({:.4f}, {:.4f})").format(lat, lon)
             elif st.session_state.searched_location_name: loc_disp = t.get('location_search_display', "Searched: {} ({:.4f}, {:.4f})").format(st.session_state.searched_location_name, lat, lon)
             else: loc_disp = f"Lat: {lat:.4f}, Lon: {lon:.4f}" # Fallback
@@ -606,168 +913,43 @@ def main():
 
     # Processing Logic
     if find_clicked:
-        st.session_state.find_button_pressed = True; st.session_state.update({'show_plot': False, 'show_custom_plot': False, 'active_result_plot_data': None, 'custom_target_plot_data': None, 'last_results': [], 'window_start_time': None, 'window_end_time': None})
+        st.session_state.update({'find_button_pressed': True, **_PLOT_RESET, **_CUSTOM_PLOT_RESET, 'last_results': [], 'window_start_time': None, 'window_end_time': None, 'window_moon_illum': None,
+                                 'csv_file_stamp': datetime.now().strftime("%Y%m%d_%H%M")}) # CSV file name stamped once per search, not on every rerun
         if observer_for_run and df_catalog_data is not None:
             with st.spinner(t.get('spinner_searching', "Calculating...")):
                 try: # Main search block
-                    start_t, end_t, win_stat = get_observable_window(observer_for_run, ref_time_main, is_now_main, lang); results_placeholder.info(win_stat)
-                    st.session_state.window_start_time = start_t; st.session_state.window_end_time = end_t
+                    ref_jd = round(ref_time_main.jd * 1440) / 1440 if is_now_main else ref_time_main.jd # 'Now' keyed per minute so the cache can hit
+                    start_t, end_t, win_stat, moon_illum = get_cached_observable_window(lat, lon, h, tz, ref_jd, is_now_main, lang); results_placeholder.info(win_stat)
+                    st.session_state.update({'window_start_time': start_t, 'window_end_time': end_t, 'window_moon_illum': moon_illum})
                     if start_t and end_t and start_t < end_t: # Valid window
-                        obs_times = Time(np.arange(start_t.jd, end_t.jd, (5*u.min).to(u.day).value), format='jd', scale='utc')
+                        obs_times = Time(np.linspace(start_t.jd, end_t.jd, max(2, math.ceil((end_t.jd - start_t.jd) / (SEARCH_STEP_MIN*u.min).to_value(u.day)) + 1)), format='jd', scale='utc') # Both window ends sampled, step <= SEARCH_STEP_MIN
                         if len(obs_times) < 2: results_placeholder.warning("Win too short.")
-                        filt_df = df_catalog_data.copy(); filt_df = filt_df[(filt_df['Mag'] >= min_mag_f) & (filt_df['Mag'] <= max_mag_f)]
-                        if sel_types_d: filt_df = filt_df[filt_df['Type'].isin(sel_types_d)]
-                        size_ok_m = df_catalog_data is not None and 'MajAx' in df_catalog_data.columns and df_catalog_data['MajAx'].notna().any()
-                        if size_ok_m: filt_df = filt_df.dropna(subset=['MajAx']); filt_df = filt_df[(filt_df['MajAx'] >= size_min_d) & (filt_df['MajAx'] <= size_max_d)]
-                        if filt_df.empty: results_placeholder.warning(t.get('warning_no_objects_found', "No objects found...") + " (init filt)"); st.session_state.last_results = []
+                        filt_mask = df_catalog_data['Mag'].between(min_mag_f, max_mag_f) # One combined boolean mask, single copy of the surviving rows
+                        if sel_types_d: filt_mask &= df_catalog_data['Type'].isin(sel_types_d)
+                        size_ok_m = 'MajAx' in df_catalog_data.columns and df_catalog_data['MajAx'].notna().any()
+                        if size_ok_m: filt_mask &= df_catalog_data['MajAx'].between(size_min_d, size_max_d) # NaN sizes compare False
+                        filt_df = df_catalog_data[filt_mask] # Boolean selection already yields a new frame - no second copy
+                        if filt_df.empty: results_placeholder.warning(t.get('warning_no_objects_found', "No objects found...") + " (init filt)")
                         else: # Find observable
-                            min_alt_s = st.session_state.min_alt_slider * u.deg
-                            found_objs = find_observable_objects(observer_for_run.location, obs_times, min_alt_s, filt_df, lang)
-                            final_objs = [] # Apply post filters
-                            sel_dir_f = st.session_state.selected_peak_direction; max_alt_f = st.session_state.max_alt_slider
-                            for obj in found_objs:
-                                if obj.get('Max Altitude (°)', -999) > max_alt_f: continue
-                                if sel_dir_f != ALL_DIRECTIONS_KEY and obj.get('Direction at Max') != sel_dir_f: continue
-                                final_objs.append(obj)
+                            sel_dir_f = st.session_state.selected_peak_direction # Max-altitude and direction filters are applied inside the search as array masks
+                            filt_key = (CATALOG_FILEPATH, float(min_mag_f), float(max_mag_f), tuple(sorted(sel_types_d)), (size_min_d, size_max_d) if size_ok_m else None)
+                            final_objs, search_msgs = get_cached_observable_objects(lat, lon, h, obs_times.jd, float(st.session_state.min_alt_slider), float(st.session_state.max_alt_slider),
+                                                                                    None if sel_dir_f == ALL_DIRECTIONS_KEY else sel_dir_f, filt_key, filt_df, lang)
+                            for msg_kind, msg in search_msgs: getattr(results_placeholder, msg_kind)(msg) # Also shown when the result came from the cache
                             sort_k = st.session_state.sort_method # Sort
-                            if sort_k == 'Brightness': final_objs.sort(key=lambda x: x.get('Magnitude', float('inf')) if x.get('Magnitude') is not None else float('inf'))
-                            else: final_objs.sort(key=lambda x: (x.get('Max Cont. Duration (h)', 0), x.get('Max Altitude (°)', 0)), reverse=True)
-                            num_show = st.session_state.num_objects_slider; st.session_state.last_results = final_objs[:num_show] # Store results
+                            if sort_k == 'Brightness': # Stable C-level argsort on key arrays instead of a Python key-function sort
+                                order = np.argsort(np.array([x.get('Magnitude') if x.get('Magnitude') is not None else np.inf for x in final_objs], dtype=float), kind='stable')
+                            else: order = np.lexsort((-np.array([x.get('Max Altitude (°)', 0) for x in final_objs], dtype=float), -np.array([x.get('Max Cont. Duration (h)', 0) for x in final_objs], dtype=float)))
+                            num_show = st.session_state.num_objects_slider; st.session_state.last_results = [final_objs[k] for k in order[:num_show]] # Store results
                             if not final_objs: results_placeholder.warning(t.get('warning_no_objects_found', "No objects found..."))
                             else: results_placeholder.success(t.get('success_objects_found', "{} objs found.").format(len(final_objs))); sort_msg = 'info_showing_list_duration' if sort_k != 'Brightness' else 'info_showing_list_magnitude'; results_placeholder.info(t.get(sort_msg, "Showing {}...").format(len(st.session_state.last_results)))
-                    else: results_placeholder.error(t.get('error_no_window', "No valid window...") + " Cannot search."); st.session_state.last_results = []
+                    else: results_placeholder.error(t.get('error_no_window', "No valid window...") + " Cannot search.")
                 except Exception as search_e: results_placeholder.error(t.get('error_search_unexpected', "Search err:") + f"\n```\n{search_e}\n```"); traceback.print_exc(); st.session_state.last_results = []
         else:
              if df_catalog_data is None: results_placeholder.error("Cannot search: Catalog missing.")
              if not observer_for_run: results_placeholder.error("Cannot search: Location invalid.")
-             st.session_state.last_results = []
 
-    # Display Results Block
-    if st.session_state.last_results:
-        results_data = st.session_state.last_results
-        results_placeholder.subheader(t.get('results_list_header', "Results"))
-        # Moon Phase Display
-        win_start, win_end = st.session_state.get('window_start_time'), st.session_state.get('window_end_time'); obs_exists = observer_for_run is not None
-        if obs_exists and isinstance(win_start, Time) and isinstance(win_end, Time):
-            mid_t = win_start + (win_end - win_start) / 2
-            try: illum = moon_illumination(mid_t); moon_pct = illum*100; moon_svg = create_moon_phase_svg(illum, 50); m_c1, m_c2 = results_placeholder.columns([1,3])
-            except Exception as moon_e: results_placeholder.warning(t.get('moon_phase_error', "Moon Err: {}").format(moon_e)); moon_pct = -1; moon_svg = None
-            if moon_svg: m_c1.markdown(moon_svg, unsafe_allow_html=True)
-            if moon_pct >= 0:
-                 with m_c2:
-                    st.metric(label=t.get('moon_metric_label', "Moon Illum."), value=f"{moon_pct:.0f}%")
-                    moon_thresh = st.session_state.moon_phase_slider
-                    if moon_pct > moon_thresh: st.warning(t.get('moon_warning_message', "Warn: Moon > ({:.0f}%)!").format(moon_pct, moon_thresh))
-        elif st.session_state.find_button_pressed: results_placeholder.info("Moon phase N/A.")
-        # Plot Type Selection
-        plot_opts = {'Sky Path': t.get('graph_type_sky_path', "Sky Path"), 'Altitude Plot': t.get('graph_type_alt_time', "Alt Plot")}
-        results_placeholder.radio(t.get('graph_type_label', "Graph:"), options=list(plot_opts.keys()), format_func=lambda k: plot_opts[k], key='plot_type_selection', horizontal=True)
-        # Object List Display
-        for i, obj_data in enumerate(results_data):
-            name, type = obj_data.get('Name','N/A'), obj_data.get('Type','N/A')
-            obj_mag = obj_data.get('Magnitude')
-            mag_s = f"{obj_mag:.1f}" if obj_mag is not None else "N/A"
-            title_format_string = t.get('results_expander_title', "{} ({}) - Mag: {}")
-            title = title_format_string.format(name, type, mag_s)
-            is_exp = (st.session_state.expanded_object_name == name)
-            obj_cont = results_placeholder.container()
-            with obj_cont.expander(title, expanded=is_exp):
-                c1, c2, c3 = st.columns([2,2,1])
-                # Col 1: Details
-                c1.markdown(t.get('results_coords_header', "**Details:**")); c1.markdown(f"**{t.get('results_export_constellation', 'Const')}:** {obj_data.get('Constellation', 'N/A')}")
-                size = obj_data.get('Size (arcmin)'); c1.markdown(f"**{t.get('results_size_label', 'Size:')}** {t.get('results_size_value', '{:.1f}\'').format(size) if size is not None else 'N/A'}")
-                c1.markdown(f"**RA:** {obj_data.get('RA', 'N/A')}"); c1.markdown(f"**Dec:** {obj_data.get('Dec', 'N/A')}")
-                # Col 2: Visibility
-                c2.markdown(t.get('results_max_alt_header', "**Max Alt:**"))
-                max_a = obj_data.get('Max Altitude (°)', 0); az_m = obj_data.get('Azimuth at Max (°)', 0); dir_m = obj_data.get('Direction at Max', 'N/A')
-                # === KORREKTUR HIER ===
-                # Format Azimuth (assume localization.py has 'results_azimuth_label': "(Az: {:.1f}°{})" or similar)
-                az_fmt_str = t.get('results_azimuth_label', "(Az: {:.1f}°{})") # Get format string
-                # Provide dummy second arg "" to avoid IndexError if localization wasn't fixed
-                az_str = az_fmt_str.format(az_m, "") if isinstance(az_m, (int, float)) else "(Az: N/A)"
-                # Format Direction
-                dir_fmt_str = t.get('results_direction_label', ", Dir: {}")
-                dir_str = dir_fmt_str.format(dir_m)
-                c2.markdown(f"**{max_a:.1f}°** {az_str}{dir_str}")
-                # =======================
-                c2.markdown(t.get('results_best_time_header', "**Best Time (Local):**"))
-                peak_t = obj_data.get('Time at Max (UTC)'); loc_t, loc_tz = get_local_time_str(peak_t, st.session_state.selected_timezone); c2.markdown(f"{loc_t} ({loc_tz})")
-                c2.markdown(t.get('results_cont_duration_header', "**Duration:**")); dur = obj_data.get('Max Cont. Duration (h)', 0); c2.markdown(t.get('results_duration_value', "{:.1f} hrs").format(dur))
-                # Col 3: Links & Plot
-                g_q = urllib.parse.quote_plus(f"{name} astronomy"); g_url = f"https://www.google.com/search?q={g_q}"; c3.markdown(f"[{t.get('google_link_text', 'Google')}]({g_url})", unsafe_allow_html=True)
-                s_q = urllib.parse.quote_plus(name); s_url = f"http://simbad.u-strasbg.fr/simbad/sim-basic?Ident={s_q}"; c3.markdown(f"[{t.get('simbad_link_text', 'SIMBAD')}]({s_url})", unsafe_allow_html=True)
-                plot_key = f"plot_{name}_{i}"
-                if st.button(t.get('results_graph_button', "📈 Plot"), key=plot_key):
-                    st.session_state.update({'plot_object_name': name, 'active_result_plot_data': obj_data, 'show_plot': True, 'show_custom_plot': False, 'expanded_object_name': name}); st.rerun()
-                # Plot Display Area
-                if st.session_state.show_plot and st.session_state.plot_object_name == name:
-                    plot_d = st.session_state.active_result_plot_data; min_l, max_l = st.session_state.min_alt_slider, st.session_state.max_alt_slider; st.markdown("---")
-                    with st.spinner(t.get('results_spinner_plotting', "Plotting...")):
-                        try: # Plot generation
-                            fig_p = create_plot(plot_d, min_l, max_l, st.session_state.plot_type_selection, lang)
-                            if fig_p:
-                                st.pyplot(fig_p); close_key = f"close_{name}_{i}"
-                                if st.button(t.get('results_close_graph_button', "Close Plot"), key=close_key): st.session_state.update({'show_plot': False, 'active_result_plot_data': None, 'expanded_object_name': None}); st.rerun()
-                            else: st.error(t.get('results_graph_not_created', "Plot fail."))
-                        except Exception as plt_e: st.error(t.get('results_graph_error', "Plot Err: {}").format(plt_e)); traceback.print_exc()
-        # CSV Export
-        if results_data:
-            csv_ph = results_placeholder.empty()
-            try: # Prepare CSV data
-                export_d = []; tz_csv = st.session_state.selected_timezone
-                for obj in results_data:
-                    peak_utc_csv = obj.get('Time at Max (UTC)'); loc_t_csv, _ = get_local_time_str(peak_utc_csv, tz_csv)
-                    export_d.append({ t.get('results_export_name',"Name"): obj.get('Name'), t.get('results_export_type',"Type"): obj.get('Type'), t.get('results_export_constellation',"Const"): obj.get('Constellation'),
-                        t.get('results_export_mag',"Mag"): obj.get('Magnitude'), t.get('results_export_size',"Size'"): obj.get('Size (arcmin)'), t.get('results_export_ra',"RA"): obj.get('RA'),
-                        t.get('results_export_dec',"Dec"): obj.get('Dec'), t.get('results_export_max_alt',"MaxAlt"): obj.get('Max Altitude (°)'), t.get('results_export_az_at_max',"Az@Max"): obj.get('Azimuth at Max (°)'),
-                        t.get('results_export_direction_at_max',"Dir@Max"): obj.get('Direction at Max'), t.get('results_export_time_max_utc',"TimeMaxUTC"): peak_utc_csv.iso if peak_utc_csv else 'N/A',
-                        t.get('results_export_time_max_local',"TimeMaxLoc"): loc_t_csv, t.get('results_export_cont_duration',"Dur(h)"): obj.get('Max Cont. Duration (h)') })
-                df_ex = pd.DataFrame(export_d); dec = ',' if lang == 'de' else '.'; csv_s = df_ex.to_csv(index=False, sep=';', encoding='utf-8-sig', decimal=dec)
-                now_s = datetime.now().strftime("%Y%m%d_%H%M"); csv_fn = t.get('results_csv_filename', "dso_list_{}.csv").format(now_s)
-                csv_ph.download_button(label=t.get('results_save_csv_button', "💾 Save CSV"), data=csv_s, file_name=csv_fn, mime='text/csv', key='csv_dl')
-            except Exception as csv_e: csv_ph.error(t.get('results_csv_export_error', "CSV Err: {}").format(csv_e))
-    elif st.session_state.find_button_pressed: results_placeholder.info(t.get('warning_no_objects_found', "No objects found..."))
-
-    # Custom Target Plotting
-    st.markdown("---")
-    with st.expander(t.get('custom_target_expander', "Plot Custom Target")):
-        with st.form("custom_form"):
-             st.text_input(t.get('custom_target_ra_label', "RA:"), key="custom_target_ra", placeholder=t.get('custom_target_ra_placeholder', "..."))
-             st.text_input(t.get('custom_target_dec_label', "Dec:"), key="custom_target_dec", placeholder=t.get('custom_target_dec_placeholder', "..."))
-             st.text_input(t.get('custom_target_name_label', "Name (Opt):"), key="custom_target_name", placeholder="My Comet")
-             custom_submitted = st.form_submit_button(t.get('custom_target_button', "Create Plot"))
-        custom_err_ph = st.empty(); custom_plot_ph = st.empty()
-        if custom_submitted: # Process custom plot
-             st.session_state.update({'show_plot': False, 'show_custom_plot': False, 'custom_target_plot_data': None, 'custom_target_error': ""})
-             cust_ra, cust_dec = st.session_state.custom_target_ra, st.session_state.custom_target_dec; cust_name = st.session_state.custom_target_name or t.get('custom_target_name_label', "Target").replace(":", "")
-             win_s_c, win_e_c = st.session_state.get('window_start_time'), st.session_state.get('window_end_time'); obs_ex_c = observer_for_run is not None
-             if not cust_ra or not cust_dec: st.session_state.custom_target_error = t.get('custom_target_error_coords', "Invalid RA/Dec."); custom_err_ph.error(st.session_state.custom_target_error)
-             elif not obs_ex_c or not isinstance(win_s_c, Time) or not isinstance(win_e_c, Time): st.session_state.custom_target_error = t.get('custom_target_error_window', "Invalid window/loc."); custom_err_ph.error(st.session_state.custom_target_error)
-             else: # Proceed
-                 try:
-                     cust_coord = SkyCoord(ra=cust_ra, dec=cust_dec, unit=(u.hourangle, u.deg))
-                     if win_s_c < win_e_c: obs_times_c = Time(np.arange(win_s_c.jd, win_e_c.jd, (5*u.min).to(u.day).value), format='jd', scale='utc')
-                     else: raise ValueError("Invalid time window.")
-                     if len(obs_times_c) < 2: raise ValueError("Time window too short.")
-                     altaz_fr_c = AltAz(obstime=obs_times_c, location=observer_for_run.location); cust_altazs = cust_coord.transform_to(altaz_fr_c)
-                     st.session_state.custom_target_plot_data = {'Name': cust_name, 'altitudes': cust_altazs.alt.to(u.deg).value, 'azimuths': cust_altazs.az.to(u.deg).value, 'times': obs_times_c}
-                     st.session_state.show_custom_plot = True; st.session_state.custom_target_error = ""; st.rerun()
-                 except ValueError as cust_coord_e: st.session_state.custom_target_error = f"{t.get('custom_target_error_coords', 'Invalid RA/Dec.')} ({cust_coord_e})"; custom_err_ph.error(st.session_state.custom_target_error)
-                 except Exception as cust_e: st.session_state.custom_target_error = f"Custom plot err: {cust_e}"; custom_err_ph.error(st.session_state.custom_target_error); traceback.print_exc()
-        # Display custom plot if exists
-        if st.session_state.show_custom_plot and st.session_state.custom_target_plot_data:
-            cust_plot_d = st.session_state.custom_target_plot_data; min_a_c, max_a_c = st.session_state.min_alt_slider, st.session_state.max_alt_slider
-            with custom_plot_ph.container():
-                 st.markdown("---");
-                 with st.spinner(t.get('results_spinner_plotting', "Plotting...")):
-                     try: # Generate custom plot
-                         fig_c = create_plot(cust_plot_d, min_a_c, max_a_c, st.session_state.plot_type_selection, lang)
-                         if fig_c:
-                             st.pyplot(fig_c);
-                             if st.button(t.get('results_close_graph_button', "Close Plot"), key="close_custom"): st.session_state.update({'show_custom_plot': False, 'custom_target_plot_data': None}); st.rerun()
-                         else: st.error(t.get('results_graph_not_created', "Plot fail."))
-                     except Exception as plt_e_c: st.error(t.get('results_graph_error', "Plot Err: {}").format(plt_e_c)); traceback.print_exc()
-        elif st.session_state.custom_target_error: custom_err_ph.error(st.session_state.custom_target_error)
+    render_results(observer_for_run, lang)
 
     # Redshift Calculator Integration
     st.markdown("---")